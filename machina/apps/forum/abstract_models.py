@@ -19,6 +19,7 @@ from mptt.models import MPTTModel, TreeForeignKey
 
 from machina.apps.forum import signals
 from machina.conf import settings as machina_settings
+from machina.core.trackers import defer_forum_trackers_update
 from machina.models import DatedModel
 from machina.models.fields import ExtendedImageField, MarkupTextField
 
@@ -173,7 +174,15 @@ class AbstractForum(MPTTModel, DatedModel):
             signals.forum_moved.send(sender=self, previous_parent=old_instance.parent)
 
     def update_trackers(self):
-        """ Updates the denormalized trackers associated with the forum instance. """
+        """ Updates the denormalized trackers associated with the forum instance.
+
+        The update is deferred if it happens inside a ``machina.core.trackers.deferred_trackers``
+        block.
+
+        """
+        if defer_forum_trackers_update(self):
+            return
+
         direct_approved_topics = self.topics.filter(approved=True).order_by('-last_post_on')
 
         # Compute the direct topics count and the direct posts count.
@@ -183,12 +192,9 @@ class AbstractForum(MPTTModel, DatedModel):
 
         # Forces the forum's 'last_post' ID and 'last_post_on' date to the corresponding values
         # associated with the topic with the latest post.
-        if direct_approved_topics.exists():
-            self.last_post_id = direct_approved_topics[0].last_post_id
-            self.last_post_on = direct_approved_topics[0].last_post_on
-        else:
-            self.last_post_id = None
-            self.last_post_on = None
+        last_topic = direct_approved_topics.only('last_post_id', 'last_post_on').first()
+        self.last_post_id = last_topic.last_post_id if last_topic else None
+        self.last_post_on = last_topic.last_post_on if last_topic else None
 
         # Any save of a forum triggered from the update_tracker process will not result in checking
         # for a change of the forum's parent.
@@ -84,7 +84,11 @@ class ForumView(PermissionRequiredMixin, ListView):
             self.forum.topics
             .exclude(type=Topic.TOPIC_ANNOUNCE)
             .exclude(approved=False)
-            .select_related('poster', 'last_post', 'last_post__poster')
+            .select_related('poster', 'first_post', 'last_post', 'last_post__poster')
+            .defer(
+                'first_post__content', 'first_post___content_rendered',
+                'last_post__content', 'last_post___content_rendered',
+            )
         )
         return qs
 
@@ -109,7 +113,11 @@ class ForumView(PermissionRequiredMixin, ListView):
         # The announces will be displayed on each page of the forum
         context['announces'] = list(
             self.get_forum()
-            .topics.select_related('poster', 'last_post', 'last_post__poster')
+            .topics.select_related('poster', 'first_post', 'last_post', 'last_post__poster')
+            .defer(
+                'first_post__content', 'first_post___content_rendered',
+                'last_post__content', 'last_post___content_rendered',
+            )
             .filter(type=Topic.TOPIC_ANNOUNCE)
         )
 
@@ -39,7 +39,9 @@ class ForumVisibilityContentTree:
         # Ensures forums last posts and related poster relations are "followed" for better
         # performance (only if we're considering a queryset).
         forums = (
-            forums.select_related('last_post', 'last_post__poster')
+            forums
+            .select_related('last_post', 'last_post__poster')
+            .defer('last_post__content', 'last_post___content_rendered')
             if isinstance(forums, QuerySet) else forums
         )
 
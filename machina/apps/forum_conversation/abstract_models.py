@@ -9,7 +9,7 @@
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q
+from django.db.models import Count, OuterRef, Subquery
 from django.utils.encoding import force_str
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
@@ -17,6 +17,7 @@ from django.utils.translation import gettext_lazy as _
 from machina.conf import settings as machina_settings
 from machina.core import validators
 from machina.core.loading import get_class
+from machina.core.trackers import defer_topic_trackers_update
 from machina.models.abstract_models import DatedModel
 from machina.models.fields import MarkupTextField
 
@@ -115,6 +116,9 @@ class AbstractTopic(models.Model):
     objects = models.Manager()
     approved_objects = ApprovedManager()
 
+    # The fields that are updated when the denormalized trackers of a topic are refreshed.
+    TRACKER_FIELDS = ['posts_count', 'first_post', 'last_post', 'last_post_on', ]
+
     class Meta:
         abstract = True
         app_label = 'forum_conversation'
@@ -124,8 +128,37 @@ class AbstractTopic(models.Model):
         verbose_name = _('Topic')
         verbose_name_plural = _('Topics')
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """ Creates a topic instance from values loaded from the database. """
+        instance = super().from_db(db, field_names, values)
+        # Keeps track of the forum and of the subject the topic was loaded with in order to detect
+        # changes of these fields when the topic is saved.
+        instance._loaded_forum_id = instance.__dict__.get('forum_id')
+        instance._loaded_subject = instance.__dict__.get('subject')
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """ Reloads the values of the fields of the topic from the database. """
+        fields = list(fields) if fields is not None else None
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        # The loaded values used to detect changes when the topic is saved must be kept in sync.
+        if fields is None or 'forum' in fields or 'forum_id' in fields:
+            self._loaded_forum_id = self.__dict__.get('forum_id')
+        if fields is None or 'subject' in fields:
+            self._loaded_subject = self.__dict__.get('subject')
+
     def __str__(self):
-        return self.first_post.subject if self.first_post is not None else self.subject
+        if self.first_post_id is None:
+            return self.subject
+        if self._meta.get_field('first_post').is_cached(self):
+            return self.first_post.subject
+        # Only the subject of the first post is fetched in order to avoid loading the whole post
+        # (and its potentially large content) when the related instance is not already cached.
+        first_post_subject = (
+            self.posts.filter(pk=self.first_post_id).values_list('subject', flat=True).first()
+        )
+        return first_post_subject if first_post_subject is not None else self.subject
 
     @property
     def is_topic(self):
@@ -161,28 +194,47 @@ class AbstractTopic(models.Model):
                 _('A topic can not be associated with a category or a link forum')
             )
 
-    def save(self, *args, **kwargs):
-        """ Saves the topic instance. """
+    def save(self, *args, skip_trackers=False, **kwargs):
+        """ Saves the topic instance.
+
+        If ``skip_trackers`` is ``True``, the trackers of the forums are not updated when the topic
+        is moved to another forum.
+
+        """
         # It is vital to track the changes of the forum associated with a topic in order to
-        # maintain counters up-to-date.
-        old_instance = None
+        # maintain counters up-to-date. The forum the topic was loaded with is used when available
+        # in order to avoid fetching the topic again.
+        old_forum_id = None
         if self.pk:
-            old_instance = self.__class__._default_manager.get(pk=self.pk)
-
-        # Update the slug field
-        self.slug = slugify(force_str(self.subject), allow_unicode=True) or 'topic'
+            old_forum_id = getattr(self, '_loaded_forum_id', None)
+            if old_forum_id is None:
+                old_forum_id = (
+                    self.__class__._default_manager
+                    .filter(pk=self.pk)
+                    .values_list('forum_id', flat=True)
+                    .first()
+                )
+
+        # Update the slug field if the subject has changed
+        if not self.slug or self.subject != getattr(self, '_loaded_subject', None):
+            self._update_slug()
 
         # Do the save
         super().save(*args, **kwargs)
+        self._loaded_forum_id = self.forum_id
+        self._loaded_subject = self.subject
 
         # If any change has been made to the parent forum, trigger the update of the counters
-        if old_instance and old_instance.forum != self.forum:
+        if not skip_trackers and old_forum_id and old_forum_id != self.forum_id:
             self.update_trackers()
             # The previous parent forum counters should also be updated
-            if old_instance.forum:
-                old_forum = old_instance.forum
-                old_forum.refresh_from_db()
-                old_forum.update_trackers()
+            forum_model = self._meta.get_field('forum').related_model
+            old_forum = forum_model._default_manager.get(pk=old_forum_id)
+            old_forum.update_trackers()
+
+    def _update_slug(self):
+        """ Updates the slug of the topic using its subject. """
+        self.slug = slugify(force_str(self.subject), allow_unicode=True) or 'topic'
 
     def _simple_save(self, *args, **kwargs):
         """ Simple wrapper around the standard save method.
@@ -203,17 +255,72 @@ class AbstractTopic(models.Model):
         self.forum.update_trackers()
 
     def update_trackers(self):
-        """ Updates the denormalized trackers associated with the topic instance. """
-        self.posts_count = self.posts.filter(approved=True).count()
-        first_post = self.posts.all().order_by('created').first()
-        last_post = self.posts.filter(approved=True).order_by('-created').first()
-        self.first_post = first_post
-        self.last_post = last_post
-        self.last_post_on = last_post.created if last_post else None
-        self._simple_save()
+        """ Updates the denormalized trackers associated with the topic instance.
+
+        The update is deferred if it happens inside a ``machina.core.trackers.deferred_trackers``
+        block.
+
+        """
+        if defer_topic_trackers_update(self):
+            return
+
+        # All the trackers are computed using a single query.
+        trackers = self._get_trackers(self.__class__._default_manager.filter(pk=self.pk)).get()
+        self.posts_count = trackers['new_posts_count'] or 0
+        self.first_post_id = trackers['new_first_post_id']
+        self.last_post_id = trackers['new_last_post_id']
+        self.last_post_on = trackers['new_last_post_on']
+        # The update date of the topic is left untouched: refreshing its trackers is not an update
+        # of the topic itself.
+        self._simple_save(update_fields=self.TRACKER_FIELDS)
         # Trigger the forum-level trackers update
         self.forum.update_trackers()
 
+    @classmethod
+    def bulk_refresh_trackers(cls, topic_ids):
+        """ Updates the denormalized trackers of the topics corresponding to the given IDs.
+
+        This is intended to be used after having saved many posts with ``skip_trackers=True`` (eg.
+        when importing posts). The trackers of all the considered topics are computed using a single
+        query and the trackers of their forums are updated once per forum.
+
+        """
+        topics = [
+            cls(
+                pk=trackers['pk'],
+                forum_id=trackers['forum_id'],
+                posts_count=trackers['new_posts_count'] or 0,
+                first_post_id=trackers['new_first_post_id'],
+                last_post_id=trackers['new_last_post_id'],
+                last_post_on=trackers['new_last_post_on'],
+            )
+            for trackers in cls._get_trackers(cls._default_manager.filter(pk__in=topic_ids))
+        ]
+        cls._default_manager.bulk_update(topics, cls.TRACKER_FIELDS)
+
+        # Trigger the forum-level trackers update
+        forum_model = cls._meta.get_field('forum').related_model
+        for forum in forum_model._default_manager.filter(pk__in={t.forum_id for t in topics}):
+            forum.update_trackers()
+
+    @classmethod
+    def _get_trackers(cls, queryset):
+        """ Returns the values of the denormalized trackers of the topics of the given queryset. """
+        posts = cls._meta.get_field('posts').related_model._default_manager.filter(
+            topic=OuterRef('pk'),
+        ).order_by()
+        approved_posts = posts.filter(approved=True)
+        return queryset.order_by().values(
+            'pk',
+            'forum_id',
+            new_posts_count=Subquery(
+                approved_posts.values('topic').annotate(count=Count('pk')).values('count'),
+            ),
+            new_first_post_id=Subquery(posts.order_by('created').values('pk')[:1]),
+            new_last_post_id=Subquery(approved_posts.order_by('-created').values('pk')[:1]),
+            new_last_post_on=Subquery(approved_posts.order_by('-created').values('created')[:1]),
+        )
+
 
 class AbstractPost(DatedModel):
     """ Represents a forum post. A forum post is always linked to a topic. """
@@ -274,6 +381,7 @@ class AbstractPost(DatedModel):
     class Meta:
         abstract = True
         app_label = 'forum_conversation'
+        indexes = [models.Index(fields=['topic', 'created']), ]
         ordering = ['created', ]
         get_latest_by = 'created'
         verbose_name = _('Post')
@@ -285,23 +393,24 @@ class AbstractPost(DatedModel):
     @property
     def is_topic_head(self):
         """ Returns ``True`` if the post is the first post of the topic. """
-        return self.topic.first_post.id == self.id if self.topic.first_post else False
+        return self.topic.first_post_id is not None and self.topic.first_post_id == self.id
 
     @property
     def is_topic_tail(self):
         """ Returns ``True`` if the post is the last post of the topic. """
-        return self.topic.last_post.id == self.id if self.topic.last_post else False
+        return self.topic.last_post_id is not None and self.topic.last_post_id == self.id
 
     @property
     def is_alone(self):
         """ Returns ``True`` if the post is the only single post of the topic. """
-        return self.topic.posts.count() == 1
+        return not self.topic.posts.exclude(pk=self.pk).exists()
 
     @property
     def position(self):
         """ Returns an integer corresponding to the position of the post in the topic. """
-        position = self.topic.posts.filter(Q(created__lt=self.created) | Q(id=self.id)).count()
-        return position
+        # The post itself is counted by adding 1 rather than by OR-ing a condition on its ID, which
+        # lets the database resolve the count using only the topic and creation date columns.
+        return self.topic.posts.filter(created__lt=self.created).count() + 1
 
     def clean(self):
         """ Validates the post instance. """
@@ -321,20 +430,52 @@ class AbstractPost(DatedModel):
         if self.anonymous_key and not self.username:
             raise ValidationError(_('A username must be specified if the poster is anonymous'))
 
-    def save(self, *args, **kwargs):
-        """ Saves the post instance. """
+    def save(self, *args, skip_trackers=False, **kwargs):
+        """ Saves the post instance.
+
+        If ``skip_trackers`` is ``True``, the topic is neither synchronized with its first post nor
+        are its trackers updated. This is intended to be used when saving many posts at once (eg.
+        when importing posts), in which case ``Topic.bulk_refresh_trackers`` should be called
+        afterwards.
+
+        """
         new_post = self.pk is None
         super().save(*args, **kwargs)
 
+        if skip_trackers:
+            return
+
+        topic = self.topic
+
         # Ensures that the subject of the thread corresponds to the one associated
-        # with the first post. Do the same with the 'approved' flag.
-        if (new_post and self.topic.first_post is None) or self.is_topic_head:
-            if self.subject != self.topic.subject or self.approved != self.topic.approved:
-                self.topic.subject = self.subject
-                self.topic.approved = self.approved
+        # with the first post. Do the same with the 'approved' flag. A topic without first post can
+        # already contain posts if the update of its trackers has been deferred, so new posts are
+        # only considered as the head of such topics if they are the only post they contain.
+        is_new_head = (
+            new_post and
+            topic.first_post_id is None and
+            not topic.posts.exclude(pk=self.pk).exists()
+        )
+        if is_new_head or self.is_topic_head:
+            if self.subject != topic.subject or self.approved != topic.approved:
+                # The slug of the topic must follow its subject because it is not updated by the
+                # simple save of the topic.
+                if self.subject != topic.subject:
+                    topic.subject = self.subject
+                    topic._update_slug()
+                topic.approved = self.approved
+                topic._simple_save(update_fields=['subject', 'slug', 'approved'])
+                topic._loaded_subject = topic.subject
 
         # Trigger the topic-level trackers update
-        self.topic.update_trackers()
+        topic.update_trackers()
+
+        # The current post is used as the first or last post of the topic if applicable, so that
+        # these posts don't have to be fetched again when they are accessed from the topic.
+        if topic.first_post_id == self.pk:
+            topic.first_post = self
+        if topic.last_post_id == self.pk:
+            topic.last_post = self
 
     def delete(self, using=None):
         """ Deletes the post instance. """
@@ -226,7 +226,7 @@ class TopicForm(PostForm):
         if 'topic_type' in self.cleaned_data and len(self.cleaned_data['topic_type']):
             if topic.type != self.cleaned_data['topic_type']:
                 topic.type = self.cleaned_data['topic_type']
-                topic._simple_save()
+                topic._simple_save(update_fields=['type', 'updated'])
 
     def save(self, commit=True):
         """ Saves the instance. """
@@ -0,0 +1,26 @@
+"""
+    Forum conversation middlewares
+    ==============================
+
+    This module defines conversation-related middlewares.
+
+"""
+
+from machina.core.trackers import deferred_trackers
+
+
+class DeferredTrackersMiddleware:
+    """ This middleware defers the updates of the trackers of topics and forums.
+
+    The trackers of the topics and forums that are modified while processing a request are updated
+    once, at the end of the request, instead of every time a post is saved or deleted. Note that
+    each request is processed inside a transaction as a result.
+
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with deferred_trackers():
+            return self.get_response(request)
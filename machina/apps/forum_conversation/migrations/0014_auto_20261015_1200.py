@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum_conversation', '0013_auto_20201220_1745'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['topic', 'created'], name='forum_conve_topic_i_a7d559_idx'),
+        ),
+    ]
@@ -53,7 +53,12 @@ class LastTopicsFeed(Feed):
 
     def items(self):
         """ Returns the items to include into the feed. """
-        return Topic.objects.filter(forum__in=self.forums, approved=True).order_by('-last_post_on')
+        return (
+            Topic.objects
+            .filter(forum__in=self.forums, approved=True)
+            .select_related('forum', 'first_post', 'last_post')
+            .order_by('-last_post_on')
+        )
 
     def item_link(self, item):
         """ Generates a link for a specific item of the feed. """
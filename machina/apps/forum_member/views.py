@@ -235,6 +235,10 @@ class TopicSubscriptionListView(LoginRequiredMixin, ListView):
         """ Returns the list of items for this view. """
         return (
             self.request.user.topic_subscriptions
-            .select_related('forum', 'poster', 'last_post', 'last_post__poster')
+            .select_related('forum', 'poster', 'first_post', 'last_post', 'last_post__poster')
+            .defer(
+                'first_post__content', 'first_post___content_rendered',
+                'last_post__content', 'last_post___content_rendered',
+            )
             .all()
         )
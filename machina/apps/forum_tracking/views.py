@@ -140,4 +140,13 @@ class UnreadTopicsView(LoginRequiredMixin, ListView):
         )
         topics = Topic.objects.filter(forum__in=forums)
         topics_pk = map(lambda t: t.pk, track_handler.get_unread_topics(topics, self.request.user))
-        return Topic.approved_objects.filter(pk__in=topics_pk).order_by('-last_post_on')
+        return (
+            Topic.approved_objects
+            .filter(pk__in=topics_pk)
+            .select_related('forum', 'poster', 'first_post', 'last_post', 'last_post__poster')
+            .defer(
+                'first_post__content', 'first_post___content_rendered',
+                'last_post__content', 'last_post___content_rendered',
+            )
+            .order_by('-last_post_on')
+        )
@@ -0,0 +1,87 @@
+"""
+    Trackers deferral
+    =================
+
+    This module provides tools allowing to defer the updates of the denormalized trackers of topics
+    and forums until the end of a block of code (or of a request). Each topic or forum whose
+    trackers should be updated is only considered once, no matter how many posts were saved or
+    deleted.
+
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+
+from machina.core.db.models import get_model
+
+
+_deferred_trackers = ContextVar('machina_deferred_trackers', default=None)
+
+
+class _DeferredTrackers:
+    def __init__(self):
+        self.topic_ids = set()
+        self.forum_ids = set()
+
+
+def defer_topic_trackers_update(topic):
+    """ Defers the update of the trackers of the given topic if possible.
+
+    Returns ``True`` if the update has been deferred, ``False`` if the trackers should be updated
+    right away because no deferral context is active.
+
+    """
+    deferred = _deferred_trackers.get()
+    if deferred is None:
+        return False
+    deferred.topic_ids.add(topic.pk)
+    return True
+
+
+def defer_forum_trackers_update(forum):
+    """ Defers the update of the trackers of the given forum if possible.
+
+    Returns ``True`` if the update has been deferred, ``False`` if the trackers should be updated
+    right away because no deferral context is active.
+
+    """
+    deferred = _deferred_trackers.get()
+    if deferred is None:
+        return False
+    deferred.forum_ids.add(forum.pk)
+    return True
+
+
+@contextmanager
+def deferred_trackers():
+    """ Defers the updates of the trackers of topics and forums until the end of the block.
+
+    The block is executed inside a transaction. The trackers of the topics and forums that were
+    modified inside the block are updated once, at the end of the block. If the block raises, the
+    transaction is rolled back and the trackers are left untouched. Nested blocks are merged into
+    the outermost one.
+
+    """
+    if _deferred_trackers.get() is not None:
+        yield
+        return
+
+    deferred = _DeferredTrackers()
+    token = _deferred_trackers.set(deferred)
+    with transaction.atomic():
+        try:
+            yield
+            # The updates of the trackers of the forums of the considered topics are collected as
+            # well so that each forum is only updated once.
+            if deferred.topic_ids:
+                Topic = get_model('forum_conversation', 'Topic')
+                Topic.bulk_refresh_trackers(deferred.topic_ids)
+        finally:
+            _deferred_trackers.reset(token)
+
+        if deferred.forum_ids:
+            Forum = get_model('forum', 'Forum')
+            for forum in Forum._default_manager.filter(pk__in=deferred.forum_ids):
+                forum.update_trackers()
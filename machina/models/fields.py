@@ -109,6 +109,13 @@ class MarkupTextDescriptor:
     def __get__(self, instance, owner):
         if instance is None:
             return None
+        if self.field.name not in instance.__dict__:
+            # The field was deferred: load it on demand, as Django does for regular fields. The
+            # rendered field is loaded at the same time if it was deferred as well.
+            instance.refresh_from_db(fields=[
+                name for name in (self.field.name, self.rendered_field_name)
+                if name not in instance.__dict__
+            ])
         raw = instance.__dict__[self.field.name]
         if raw is None:
             return None
@@ -119,7 +126,14 @@ class MarkupTextDescriptor:
             instance.__dict__[self.field.name] = value.raw
             setattr(instance, self.rendered_field_name, value.rendered)
         else:
-            # Set only the raw field
+            # Set only the raw field. If the instance was loaded with a deferred rendered field,
+            # this one is loaded so that it is not excluded from the fields saved by Django for
+            # deferred instances (otherwise the rendered content would not be updated on save).
+            if (
+                not instance._state.adding and
+                self.rendered_field_name not in instance.__dict__
+            ):
+                instance.refresh_from_db(fields=[self.rendered_field_name])
             instance.__dict__[self.field.name] = value
 
 
@@ -706,8 +706,10 @@ class TestTopicUpdateView(BaseClientTestCase):
         # Check
         topic_url = reverse(
             'forum_conversation:topic',
-            kwargs={'forum_slug': self.top_level_forum.slug, 'forum_pk': self.top_level_forum.pk,
-                    'slug': self.topic.slug, 'pk': self.topic.pk})
+            kwargs={
+                'forum_slug': self.top_level_forum.slug, 'forum_pk': self.top_level_forum.pk,
+                'slug': response.context_data['topic'].slug,
+                'pk': response.context_data['topic'].pk})
         assert len(response.redirect_chain)
         last_url, status_code = response.redirect_chain[-1]
         assert topic_url in last_url
@@ -90,6 +90,23 @@ class TestTopic(object):
         self.topic.refresh_from_db()
         assert self.topic.last_post_on == middle_post.created
 
+    def test_uses_the_subject_of_its_first_post_as_string_representation(self):
+        # Setup
+        self.post.subject = 'New subject'
+        self.post.save()
+        topic = Topic.objects.get(pk=self.topic.pk)
+        # Run & check
+        assert str(topic) == 'New subject'
+        assert str(create_topic(forum=self.top_level_forum, poster=self.u1, subject='foo')) == 'foo'
+
+    def test_does_not_change_its_update_date_when_its_trackers_are_updated(self):
+        # Setup
+        initial_updated_date = Topic.objects.get(pk=self.topic.pk).updated
+        # Run
+        PostFactory.create(topic=self.topic, poster=self.u1)
+        # Check
+        assert Topic.objects.get(pk=self.topic.pk).updated == initial_updated_date
+
     def test_has_the_first_post_name_as_subject(self):
         # Run & check
         assert self.topic.subject == self.post.subject
@@ -117,6 +134,31 @@ class TestTopic(object):
         post.delete()
         assert initial_count == self.topic.posts_count
 
+    def test_can_refresh_the_trackers_of_many_topics_at_once(self):
+        # Setup
+        other_topic = create_topic(forum=self.top_level_forum, poster=self.u1)
+        first_post = PostFactory.build(topic=other_topic, poster=self.u1)
+        middle_post = PostFactory.build(topic=self.topic, poster=self.u1)
+        last_post = PostFactory.build(topic=other_topic, poster=self.u1)
+        unapproved_post = PostFactory.build(topic=other_topic, poster=self.u1, approved=False)
+        for post in [first_post, middle_post, last_post, unapproved_post]:
+            post.save(skip_trackers=True)
+        other_topic.refresh_from_db()
+        assert other_topic.posts_count == 0
+        assert other_topic.first_post is None
+        # Run
+        Topic.bulk_refresh_trackers([self.topic.pk, other_topic.pk])
+        # Check
+        self.topic.refresh_from_db()
+        other_topic.refresh_from_db()
+        self.top_level_forum.refresh_from_db()
+        assert self.topic.posts_count == 2
+        assert other_topic.posts_count == 2
+        assert other_topic.first_post == first_post
+        assert other_topic.last_post == last_post
+        assert other_topic.last_post_on == last_post.created
+        assert self.top_level_forum.direct_posts_count == 4
+
     def test_can_not_be_associated_with_a_forum_link_or_a_forum_category(self):
         # Setup
         top_level_cat = create_category_forum()
@@ -152,6 +194,37 @@ class TestTopic(object):
         assert self.top_level_forum.direct_topics_count == 0
         assert self.top_level_forum.direct_posts_count == 0
 
+    def test_can_trigger_the_update_of_the_counters_of_forums_when_it_was_loaded_from_the_db(self):
+        # Setup
+        new_top_level_forum = create_forum()
+        topic = Topic.objects.get(pk=self.topic.pk)
+        # Run
+        topic.forum = new_top_level_forum
+        topic.save()
+        # Check
+        self.top_level_forum.refresh_from_db()
+        new_top_level_forum.refresh_from_db()
+        assert self.top_level_forum.direct_topics_count == 0
+        assert new_top_level_forum.direct_topics_count == 1
+
+    def test_can_trigger_the_update_of_the_counters_of_forums_when_it_was_refreshed(self):
+        # Setup
+        forum_2 = create_forum()
+        forum_3 = create_forum()
+        topic = Topic.objects.get(pk=self.topic.pk)
+        Topic.objects.filter(pk=topic.pk).update(forum=forum_2)
+        forum_2.update_trackers()
+        self.top_level_forum.update_trackers()
+        topic.refresh_from_db()
+        # Run
+        topic.forum = forum_3
+        topic.save()
+        # Check
+        forum_2.refresh_from_db()
+        forum_3.refresh_from_db()
+        assert forum_2.direct_topics_count == 0
+        assert forum_3.direct_topics_count == 1
+
     def test_knows_if_a_user_has_subscribed_to_the_topic(self):
         # Setup
         self.topic.subscribers.add(self.u1)
@@ -165,6 +238,42 @@ class TestTopic(object):
         topic = create_topic(forum=self.top_level_forum, poster=self.u1, subject='你好')
         assert topic.slug == '你好'
 
+    def test_updates_its_slug_when_its_subject_changes(self):
+        # Setup
+        topic = Topic.objects.get(pk=self.topic.pk)
+        # Run
+        topic.subject = 'New subject'
+        topic.save()
+        # Check
+        assert topic.slug == 'new-subject'
+        assert Topic.objects.get(pk=topic.pk).slug == 'new-subject'
+
+    def test_updates_its_slug_when_its_subject_changes_after_having_been_refreshed(self):
+        # Setup
+        topic = create_topic(forum=self.top_level_forum, poster=self.u1, subject='a')
+        topic = Topic.objects.get(pk=topic.pk)
+        Topic.objects.filter(pk=topic.pk).update(subject='b', slug='b')
+        topic.refresh_from_db()
+        # Run
+        topic.subject = 'a'
+        topic.save()
+        # Check
+        assert Topic.objects.get(pk=topic.pk).slug == 'a'
+
+    def test_updates_its_slug_when_the_subject_of_its_first_post_changes(self):
+        # Setup
+        topic = create_topic(forum=self.top_level_forum, poster=self.u1, subject='old subject')
+        post = PostFactory.create(topic=topic, poster=self.u1, subject='old subject')
+        # Run
+        post.subject = 'brand new'
+        post.save()
+        topic = Topic.objects.get(pk=topic.pk)
+        topic.status = Topic.TOPIC_LOCKED
+        topic.save()
+        # Check
+        assert Topic.objects.get(pk=topic.pk).subject == 'brand new'
+        assert Topic.objects.get(pk=topic.pk).slug == 'brand-new'
+
     def test_fallback_the_slug_to_a_hardcoded_value_if_the_generated_slug_is_empty(self):
         topic = create_topic(forum=self.top_level_forum, poster=self.u1, subject='&&')
         assert topic.slug == 'topic'
@@ -192,9 +301,21 @@ class TestPost(object):
         post = PostFactory.create(topic=self.topic, poster=self.u1)
         assert post.is_topic_tail
 
+    def test_is_used_as_the_cached_first_and_last_posts_of_its_topic_when_saved(self):
+        # Setup
+        topic = create_topic(forum=self.top_level_forum, poster=self.u1)
+        post = PostFactory.build(topic=topic, poster=self.u1)
+        # Run
+        post.save()
+        # Check
+        assert topic.first_post is post
+        assert topic.last_post is post
+
     def test_knows_if_it_is_alone_in_the_topic(self):
         # Run & check
         assert self.post.is_alone
+        PostFactory.create(topic=self.topic, poster=self.u1)
+        assert not self.post.is_alone
 
     def test_knows_its_position_inside_the_topic(self):
         # Setup
@@ -438,10 +438,8 @@ class TestPermissionHandler(object):
     def test_knows_that_a_user_should_no_vote_in_a_completed_poll(self):
         # Setup
         poll = TopicPollFactory.create(topic=self.forum_1_topic, duration=2)
-        poll._meta.get_field('updated').auto_now = False
-        poll.created = dt.datetime(2000, 1, 12)
-        poll.save()
-        poll._meta.get_field('updated').auto_now = True
+        poll.__class__._default_manager.filter(pk=poll.pk).update(created=dt.datetime(2000, 1, 12))
+        poll.refresh_from_db()
         assign_perm('can_vote_in_polls', self.u1, self.forum_1)
         # Run & check
         assert not self.perm_handler.can_vote_in_poll(poll, self.u1)
@@ -4,6 +4,7 @@ import pytest
 from django.conf import settings
 from django.core import management
 from faker import Faker
+from haystack import connections
 from haystack.query import SearchQuerySet
 
 from machina.apps.forum_search.forms import SearchForm
@@ -40,15 +41,6 @@ class TestSearchForm(object):
         #         forum_2
         #             forum_2_child_1
         #     top_level_forum_1
-        #     top_level_forum_2
-        #         sub_cat
-        #             sub_sub_forum
-        #     top_level_forum_3
-        #         forum_3
-        #             forum_3_child_1
-        #                 forum_3_child_1_1
-        #                     deep_forum
-        #     last_forum
         #
         self.top_level_cat = create_category_forum()
 
@@ -58,18 +50,6 @@ class TestSearchForm(object):
 
         self.top_level_forum_1 = create_forum()
 
-        self.top_level_forum_2 = create_forum()
-        self.sub_cat = create_category_forum(parent=self.top_level_forum_2)
-        self.sub_sub_forum = create_forum(parent=self.sub_cat)
-
-        self.top_level_forum_3 = create_forum()
-        self.forum_3 = create_forum(parent=self.top_level_forum_3)
-        self.forum_3_child_1 = create_forum(parent=self.forum_3)
-        self.forum_3_child_1_1 = create_forum(parent=self.forum_3_child_1)
-        self.deep_forum = create_forum(parent=self.forum_3_child_1_1)
-
-        self.last_forum = create_forum()
-
         # Set up a topic and some posts
         self.topic_1 = create_topic(forum=self.forum_1, poster=self.user)
         self.post_1 = PostFactory.create(topic=self.topic_1, poster=self.user)
@@ -101,6 +81,12 @@ class TestSearchForm(object):
     def teardown_class(cls):
         shutil.rmtree(settings.HAYSTACK_CONNECTIONS['default']['PATH'])
 
+    def update_index(self, *posts):
+        # Only the given posts are (re)indexed rather than rebuilding the whole index.
+        index = connections['default'].get_unified_index().get_index(Post)
+        for post in posts:
+            index.update_object(post)
+
     def test_can_search_forum_posts(self):
         # Setup
         form = SearchForm(
@@ -164,8 +150,9 @@ class TestSearchForm(object):
         self.topic_2.first_post.save()
         self.topic_3.first_post.subject = 'newsubject'
         self.topic_3.first_post.save()
-        management.call_command('clear_index', verbosity=0, interactive=False)
-        management.call_command('update_index', verbosity=0)
+        self.update_index(
+            self.topic_1.first_post, self.topic_2.first_post, self.topic_3.first_post,
+        )
         form = SearchForm(
             {
                 'q': 'newsubject',
@@ -190,8 +177,9 @@ class TestSearchForm(object):
         self.topic_3.first_post.save()
         post_4 = PostFactory.create(
             subject='newsubject', topic=self.topic_3, poster=None, username='newtest')
-        management.call_command('clear_index', verbosity=0, interactive=False)
-        management.call_command('update_index', verbosity=0)
+        self.update_index(
+            self.topic_1.first_post, self.topic_2.first_post, self.topic_3.first_post, post_4,
+        )
         form = SearchForm(
             {
                 'q': 'newsubject',
@@ -210,6 +198,7 @@ class TestSearchForm(object):
         # Setup
         self.topic_2.first_post.subject = self.topic_1.subject
         self.topic_2.first_post.save()
+        # The index is rebuilt because the statistics of updated documents would alter the ranking.
         management.call_command('clear_index', verbosity=0, interactive=False)
         management.call_command('update_index', verbosity=0)
         form = SearchForm(
@@ -0,0 +1,71 @@
+import pytest
+
+from machina.core.db.models import get_model
+from machina.core.trackers import deferred_trackers
+from machina.test.factories import PostFactory, UserFactory, create_forum, create_topic
+
+
+Forum = get_model('forum', 'Forum')
+Post = get_model('forum_conversation', 'Post')
+Topic = get_model('forum_conversation', 'Topic')
+
+
+@pytest.mark.django_db
+class TestDeferredTrackers(object):
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.u1 = UserFactory.create()
+        self.forum = create_forum()
+        self.topic = create_topic(forum=self.forum, poster=self.u1)
+        self.post = PostFactory.create(topic=self.topic, poster=self.u1)
+
+    def test_can_defer_the_update_of_the_trackers_of_topics_and_forums(self):
+        # Run & check
+        with deferred_trackers():
+            PostFactory.create(topic=self.topic, poster=self.u1)
+            with deferred_trackers():
+                post_2 = PostFactory.create(topic=self.topic, poster=self.u1)
+            topic = Topic.objects.get(pk=self.topic.pk)
+            assert topic.posts_count == 1
+            assert topic.last_post == self.post
+        topic = Topic.objects.get(pk=self.topic.pk)
+        forum = Forum.objects.get(pk=self.forum.pk)
+        assert topic.posts_count == 3
+        assert topic.last_post == post_2
+        assert forum.direct_posts_count == 3
+        assert forum.last_post == post_2
+
+    def test_keeps_the_subject_of_the_first_post_for_topics_created_in_the_block(self):
+        # Run
+        with deferred_trackers():
+            topic = create_topic(forum=self.forum, poster=self.u1, subject='first')
+            first_post = PostFactory.create(topic=topic, poster=self.u1, subject='first')
+            PostFactory.create(topic=topic, poster=self.u1, subject='reply', approved=False)
+        # Check
+        topic = Topic.objects.get(pk=topic.pk)
+        assert topic.subject == 'first'
+        assert topic.approved
+        assert topic.first_post == first_post
+
+    def test_can_defer_the_update_of_the_trackers_of_the_forums_of_deleted_topics(self):
+        # Run
+        with deferred_trackers():
+            self.post.delete()
+            assert Forum.objects.get(pk=self.forum.pk).direct_topics_count == 1
+        # Check
+        forum = Forum.objects.get(pk=self.forum.pk)
+        assert forum.direct_topics_count == 0
+        assert forum.direct_posts_count == 0
+        assert forum.last_post is None
+
+    def test_rolls_back_the_changes_made_in_the_block_if_it_raises(self):
+        # Run
+        with pytest.raises(ValueError):
+            with deferred_trackers():
+                post = PostFactory.create(topic=self.topic, poster=self.u1)
+                raise ValueError
+        # Check
+        assert not Post.objects.filter(pk=post.pk).exists()
+        topic = Topic.objects.get(pk=self.topic.pk)
+        assert topic.posts_count == 1
+        assert topic.last_post == self.post
@@ -60,6 +60,31 @@ class TestMarkupTextField(object):
         with pytest.raises(AttributeError):
             print(DummyModel.content.rendered)
 
+    def test_can_load_its_data_on_demand_if_it_was_deferred(self, django_assert_num_queries):
+        # Setup
+        test = DummyModel()
+        test.content = '**hello**'
+        test.save()
+        test = DummyModel.objects.defer('content', '_content_rendered').get(pk=test.pk)
+        # Run & check
+        with django_assert_num_queries(1):
+            assert test.content.raw == '**hello**'
+            assert test.content.rendered.rstrip() == '<p><strong>hello</strong></p>'
+
+    def test_updates_its_rendered_data_on_save_if_it_was_deferred(self):
+        # Setup
+        test = DummyModel()
+        test.content = '**a**'
+        test.save()
+        test = DummyModel.objects.defer('content', '_content_rendered').get(pk=test.pk)
+        # Run
+        test.content = '**b**'
+        test.save()
+        # Check
+        test = DummyModel.objects.get(pk=test.pk)
+        assert test.content.raw == '**b**'
+        assert test.content.rendered.rstrip() == '<p><strong>b</strong></p>'
+
     def test_content_returns_the_raw_value_when_converted_to_a_string(self):
         # Setup
         test = DummyModel()